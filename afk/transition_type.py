@@ -1,11 +1,18 @@
 """TransitionType value class for validated transition type identifiers."""
 
+import functools
 import re
 
 
 _TRANSITION_TYPE_PATTERN = re.compile(r"^[a-z][a-z0-9_.-]*$")
 
 
+@functools.lru_cache(maxsize=128)
+def _is_valid(value: str) -> bool:
+    """Pattern check, cached: workflows reuse a handful of transition types."""
+    return _TRANSITION_TYPE_PATTERN.match(value) is not None
+
+
 class TransitionType:
     """Immutable value class for transition type identifiers.
 
@@ -19,7 +26,7 @@ class TransitionType:
     def __init__(self, value: str) -> None:
         if not isinstance(value, str):
             raise TypeError(f"expected str, got {value!r}")
-        if not _TRANSITION_TYPE_PATTERN.match(value):
+        if not _is_valid(value):
             raise ValueError(
                 f"TransitionType must match pattern ^[a-z][a-z0-9_.-]*$: {value!r}"
             )
@@ -0,0 +1,161 @@
+import os
+import shutil
+import subprocess
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from afk.driver import Driver
+from afk.git import Git
+
+# tmpfs mount used for pytest temp dirs when available (Linux)
+_TMPFS_ROOT = Path("/dev/shm")
+
+_GIT_CONFIG = """\
+[user]
+	email = test@test.com
+	name = Test User
+[init]
+	defaultBranch = main
+	templateDir =
+[core]
+	fsync = none
+"""
+_GIT_DATE = "2025-01-01T12:00:00+00:00"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Tests write many small files (fake CLI scripts, git objects, turn logs).
+    # Keep them in memory instead of on disk unless the user chose a location.
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(_TMPFS_ROOT)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int | None:
+    # `-n auto`: leave two cores for the git and fake claude processes tests spawn.
+    # An explicit PYTEST_XDIST_AUTO_NUM_WORKERS or `-n logical` still goes to
+    # xdist's own hook.
+    if "PYTEST_XDIST_AUTO_NUM_WORKERS" in os.environ:
+        return None
+    if config.option.numprocesses == "logical":
+        return None
+    # Count the CPUs this process may run on, not the host's (CI cgroups, taskset)
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, cpus - 2)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def git_config(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Global git config for every git process the tests start.
+
+    Gives commits an identity without per-repo `git config` calls, pins the
+    default branch name, skips fsync for throwaway repos (git >= 2.36), and
+    keeps the user's and system git config out. An empty init template leaves
+    out the sample hooks, so template repos are half as many files to copy.
+    Commit dates are pinned too, so commit hashes are reproducible.
+    """
+    config = tmp_path_factory.mktemp("gitcfg") / "config"
+    config.write_text(_GIT_CONFIG)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_GLOBAL", str(config))
+        mp.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        mp.setenv("GIT_AUTHOR_DATE", _GIT_DATE)
+        mp.setenv("GIT_COMMITTER_DATE", _GIT_DATE)
+        yield config
+
+
+@pytest.fixture(scope="session")
+def fake_claude_noop(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a no-op fake claude CLI script once. Returns bin dir for PATH."""
+    fake_bin = tmp_path_factory.mktemp("fake_bin")
+    script = fake_bin / "claude"
+    script.write_text("""#!/bin/sh
+# Handle --version for Driver._check_environment()
+if [ "$1" = "--version" ]; then
+    echo "claude-fake 1.0.0"
+    exit 0
+fi
+echo "fake claude"
+exit 0
+""")
+    script.chmod(0o755)
+    return fake_bin
+
+
+def _init_repo(repo: Path, *, initial_commit: bool = False) -> None:
+    """Run `git init` in repo unless it is already a repo, then optionally commit.
+
+    The initial commit is empty; its identity comes from the git_config fixture.
+    """
+    commands: list[list[str]] = []
+    if not (repo / ".git").exists():
+        commands.append(["git", "init", "-q"])
+    if initial_commit:
+        commands.append(["git", "commit", "--allow-empty", "-q", "-m", "initial"])
+    for command in commands:
+        subprocess.run(
+            command,
+            cwd=repo,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+@pytest.fixture(scope="session")
+def repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Git repo with no commits, built once per session (per xdist worker).
+
+    Fixtures copy it into their tmp_path; never mutate it directly.
+    """
+    repo = tmp_path_factory.mktemp("template") / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def repo_template_with_commit(
+    tmp_path_factory: pytest.TempPathFactory, repo_template: Path
+) -> Path:
+    """Copy of repo_template with an initial empty commit, built once."""
+    repo = tmp_path_factory.mktemp("template_with_commit") / "repo"
+    shutil.copytree(repo_template, repo)
+    _init_repo(repo, initial_commit=True)
+    return repo
+
+
+SharedEnvFactory = Callable[[str, Path | None], tuple[Path, Driver, Git]]
+
+
+@pytest.fixture(scope="session")
+def shared_env_factory(
+    tmp_path_factory: pytest.TempPathFactory, fake_claude_noop: Path
+) -> SharedEnvFactory:
+    """Build a repo/Driver/Git triple for session- or class-scoped fixtures.
+
+    The non-function-scoped counterpart of session_env_factory: those fixtures
+    can't use monkeypatch, so PATH is only patched while Driver() runs. The
+    repo is a copy of template, or a plain empty directory when it is None.
+    """
+
+    def make(name: str, template: Path | None) -> tuple[Path, Driver, Git]:
+        repo = tmp_path_factory.mktemp(name) / "repo"
+        if template is None:
+            repo.mkdir()
+        else:
+            shutil.copytree(template, repo)
+        # Driver() checks the environment, so fake claude must be on PATH here too
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("PATH", f"{fake_claude_noop}:{os.environ['PATH']}")
+            driver = Driver(repo)
+        return repo, driver, Git(str(repo))
+
+    return make
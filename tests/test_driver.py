@@ -1,8 +1,10 @@
+import functools
 import os
 import signal
 import subprocess
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 
@@ -21,23 +23,32 @@ def working_dir(tmp_path: Path) -> Path:
     return work_dir
 
 
-def fake_claude(
-    tmp_path: Path, *, exit_code: int = 0, output: str = "", delay: float = 0
-) -> Path:
-    """Create a fake claude CLI script. Returns path to bin directory for PATH injection."""
-    fake_bin = tmp_path / f"bin_{exit_code}_{delay}"
-    fake_bin.mkdir(exist_ok=True)
-    script = fake_bin / "claude"
+FakeClaude = Callable[..., Path]
 
-    delay_cmd = f"sleep {delay}" if delay else ""
-    script.write_text(f"""#!/bin/bash
+
+@pytest.fixture(scope="session")
+def fake_claude(tmp_path_factory: pytest.TempPathFactory) -> FakeClaude:
+    """Factory for fake claude CLI scripts. Returns bin directory for PATH injection.
+
+    Each (exit_code, output, delay) variant is written once per test session.
+    """
+
+    @functools.cache
+    def make(*, exit_code: int = 0, output: str = "", delay: float = 0) -> Path:
+        fake_bin = tmp_path_factory.mktemp(f"bin_{exit_code}_{delay}")
+        script = fake_bin / "claude"
+
+        delay_cmd = f"sleep {delay}" if delay else ""
+        script.write_text(f"""#!/bin/sh
 echo "Claude received: $@"
 {f'echo "{output}"' if output else ""}
 {delay_cmd}
 exit {exit_code}
 """)
-    script.chmod(0o755)
-    return fake_bin
+        script.chmod(0o755)
+        return fake_bin
+
+    return make
 
 
 class TestDriverInit:
@@ -123,8 +134,10 @@ class TestDriverBuildCommand:
 
 
 class TestDriverRunWithFakeCLI:
-    def test_executes_and_returns_exit_code_zero(self, tmp_path: Path):
-        cli = fake_claude(tmp_path)
+    def test_executes_and_returns_exit_code_zero(
+        self, tmp_path: Path, fake_claude: FakeClaude
+    ):
+        cli = fake_claude()
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -151,10 +164,10 @@ sys.exit(exit_code)
         )
         assert result.returncode == 0
 
-    def test_returns_nonzero_exit_code_on_failure(self, tmp_path: Path):
-        cli = fake_claude(
-            tmp_path, exit_code=1, output="Claude error: something went wrong"
-        )
+    def test_returns_nonzero_exit_code_on_failure(
+        self, tmp_path: Path, fake_claude: FakeClaude
+    ):
+        cli = fake_claude(exit_code=1, output="Claude error: something went wrong")
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -181,8 +194,8 @@ sys.exit(exit_code)
         )
         assert result.returncode == 1
 
-    def test_creates_log_file(self, tmp_path: Path):
-        cli = fake_claude(tmp_path)
+    def test_creates_log_file(self, tmp_path: Path, fake_claude: FakeClaude):
+        cli = fake_claude()
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "logs" / "test.log")
@@ -208,8 +221,8 @@ driver.run('test prompt', '{log_file}')
         )
         assert Path(log_file).exists()
 
-    def test_log_file_contains_output(self, tmp_path: Path):
-        cli = fake_claude(tmp_path)
+    def test_log_file_contains_output(self, tmp_path: Path, fake_claude: FakeClaude):
+        cli = fake_claude()
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -236,8 +249,8 @@ driver.run('hello world prompt', '{log_file}')
         content = Path(log_file).read_text()
         assert "hello world prompt" in content
 
-    def test_model_flag_passed_to_cli(self, tmp_path: Path):
-        cli = fake_claude(tmp_path)
+    def test_model_flag_passed_to_cli(self, tmp_path: Path, fake_claude: FakeClaude):
+        cli = fake_claude()
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -270,8 +283,8 @@ class TestDriverSignalHandling:
     @pytest.mark.skipif(
         sys.platform == "win32", reason="SIGINT not available on Windows"
     )
-    def test_sigint_terminates_process(self, tmp_path: Path):
-        cli = fake_claude(tmp_path, delay=5)
+    def test_sigint_terminates_process(self, tmp_path: Path, fake_claude: FakeClaude):
+        cli = fake_claude(delay=5)
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -307,9 +320,11 @@ driver.run('test prompt', '{log_file}')
     @pytest.mark.skipif(
         sys.platform == "win32", reason="SIGINT not available on Windows"
     )
-    def test_log_created_after_completion(self, tmp_path: Path):
+    def test_log_created_after_completion(
+        self, tmp_path: Path, fake_claude: FakeClaude
+    ):
         """Log file should exist after driver completes normally."""
-        cli = fake_claude(tmp_path, delay=0.1)
+        cli = fake_claude(delay=0.1)
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -348,14 +363,16 @@ driver.run('test prompt', '{log_file}')
         sys.platform != "linux",
         reason="Linux only: macOS script command doesn't preserve logs on signal kill",
     )
-    def test_log_preserved_after_signal_kill(self, tmp_path: Path):
+    def test_log_preserved_after_signal_kill(
+        self, tmp_path: Path, fake_claude: FakeClaude
+    ):
         """Log file should exist after process is killed by signal.
 
         On Linux, the script command writes partial logs when killed.
         On macOS, the script command does NOT write logs when killed mid-execution.
         This is a platform limitation, not a bug in our code.
         """
-        cli = fake_claude(tmp_path, delay=30)  # Long delay, will be killed
+        cli = fake_claude(delay=30)  # Long delay, will be killed
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
         log_file = str(tmp_path / "test.log")
@@ -405,8 +422,8 @@ class TestCLIAvailability:
         """Should use 'claude --version' instead of 'which claude'."""
         import afk.driver
 
-        # Reset the cached check
-        afk.driver._env_checked = False  # pyright: ignore[reportPrivateUsage]
+        # Reset the cached check; monkeypatch restores it so later tests skip it
+        monkeypatch.setattr(afk.driver, "_env_checked", False)
 
         calls: list[list[str]] = []
 
@@ -436,7 +453,7 @@ class TestCLIAvailability:
         """Error message should indicate CLI is unavailable."""
         import afk.driver
 
-        afk.driver._env_checked = False  # pyright: ignore[reportPrivateUsage]
+        monkeypatch.setattr(afk.driver, "_env_checked", False)
 
         original_run = subprocess.run
 
@@ -462,7 +479,7 @@ class TestCLIAvailability:
         """Error message should mention version check failed."""
         import afk.driver
 
-        afk.driver._env_checked = False  # pyright: ignore[reportPrivateUsage]
+        monkeypatch.setattr(afk.driver, "_env_checked", False)
 
         original_run = subprocess.run
 
@@ -1,5 +1,5 @@
+import shutil
 import subprocess
-import uuid
 from pathlib import Path
 
 import pytest
@@ -8,35 +8,20 @@ from afk.git import Git
 
 
 @pytest.fixture
-def git_repo(tmp_path: Path) -> Git:
-    """Create a temp git repo with user config for commits."""
-    subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=tmp_path,
-        check=True,
-        capture_output=True,
-    )
+def git_repo(tmp_path: Path, repo_template: Path) -> Git:
+    """Create a temp git repo; commit identity comes from the conftest git config."""
+    shutil.copytree(repo_template, tmp_path, dirs_exist_ok=True)
     return Git(str(tmp_path))
 
 
 def make_commit(git: Git, message: str) -> str:
-    """Helper to create a commit and return its hash."""
-    repo_path = Path(git.repo_path)
-    filename = f"file_{uuid.uuid4().hex[:8]}.txt"
-    (repo_path / filename).write_text(f"commit: {message}")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+    """Helper to create an empty commit and return its hash."""
     subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=repo_path,
+        ["git", "commit", "--allow-empty", "-q", "-m", message],
+        cwd=git.repo_path,
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     commit_hash = git.head_commit()
     assert commit_hash is not None
@@ -214,35 +199,39 @@ class TestRootCommit:
             ["git", "checkout", "--orphan", "orphan"],
             cwd=tmp_path,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         (tmp_path / "orphan.txt").write_text("orphan")
         subprocess.run(
-            ["git", "add", "."], cwd=tmp_path, check=True, capture_output=True
+            ["git", "add", "."],
+            cwd=tmp_path,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "root B"],
             cwd=tmp_path,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Merge unrelated histories to have both roots reachable from HEAD
-        subprocess.run(
-            ["git", "checkout", "master"],
-            cwd=tmp_path,
-            capture_output=True,
-        )
         subprocess.run(
             ["git", "checkout", "main"],
             cwd=tmp_path,
-            capture_output=True,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "merge", "--allow-unrelated-histories", "-m", "merge", "orphan"],
             cwd=tmp_path,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         with pytest.raises(RuntimeError, match=r"\d+ root commits"):
@@ -250,7 +239,13 @@ class TestRootCommit:
 
     def test_empty_repo_raises(self, tmp_path: Path):
         """Empty repo should raise error (git rev-list fails on unborn HEAD)."""
-        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=tmp_path,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         git = Git(str(tmp_path))
 
         with pytest.raises(RuntimeError):
@@ -329,7 +324,13 @@ class TestGitIsEmptyDirectory:
 
     def test_returns_true_for_git_repo_only(self, tmp_path: Path) -> None:
         """is_empty_directory() returns True for dir with only .git folder."""
-        subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=tmp_path,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         git = Git(str(tmp_path))
         # Only .git exists, so "empty" from user content perspective
         assert git.is_empty_directory() is True
@@ -350,7 +351,8 @@ class TestGitTagExists:
             ["git", "tag", "v1.0.0", commit_hash],
             cwd=tmp_path,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         assert git_repo.tag_exists("v1.0.0") is True
 
@@ -384,7 +386,8 @@ class TestGitTag:
             ["git", "tag", "existing-tag", commit_hash],
             cwd=tmp_path,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         with pytest.raises(RuntimeError, match="Tag already exists"):
@@ -1,6 +1,9 @@
+import functools
 import os
+import re
+import shutil
 import subprocess
-import uuid
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,12 +18,42 @@ from afk.turn_result import TurnResult
 
 FIXED_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
-
-def make_result(n: int, transition_type: str = "coding") -> TurnResult:
-    """Helper to create TurnResult instances for testing."""
+# Shared transition types; TransitionType is immutable
+TT_INIT = TransitionType("init")
+TT_CODING = TransitionType("coding")
+TT_TEST = TransitionType("test")
+
+# Compiled once for pytest.raises(match=...)
+_FIRST_TURN_NOT_ONE = re.compile("First turn must be turn 1")
+_MUST_BE_GT_5 = re.compile("must be > 5")
+_MUST_BE_GT_1 = re.compile("must be > 1")
+_EXPECTED_PATH = re.compile("expected Path, got '/some/path'")
+_MUST_BE_ABSOLUTE = re.compile("must be an absolute path")
+_MUST_BE_DIRECTORY = re.compile("must be a directory")
+_EXPECTED_DRIVER = re.compile("expected Driver, got 'not a driver'")
+_EXPECTED_GIT = re.compile("expected Git, got 'not a git'")
+_EXPECTED_TURN_RESULT = re.compile("expected TurnResult, got 'not a result'")
+_NAME_EMPTY = re.compile("cannot be empty")
+_NAME_CHARSET = re.compile("alphanumerics and underscores")
+_NAME_TOO_LONG = re.compile("cannot exceed 64 characters")
+_EXPECTED_STR = re.compile("expected str")
+_NO_COMMIT = re.compile("No commit")
+_EXIT_CODE_1 = re.compile("Exit code: 1")
+_NOT_REPO_NOT_EMPTY = re.compile("not a git repo and not empty")
+_TAG_EXISTS = re.compile("Tag already exists")
+_TURN_1_TAG_EXISTS = re.compile("Tag already exists.*afk-collision_test-1")
+_NEEDS_COMMIT = re.compile("requires at least one commit")
+
+
+@functools.cache
+def make_result(n: int, transition_type: TransitionType = TT_CODING) -> TurnResult:
+    """Helper to create TurnResult instances for testing.
+
+    Cached: TurnResult is immutable, so equal arguments share one instance.
+    """
     return TurnResult(
         turn_number=n,
-        transition_type=TransitionType(transition_type),
+        transition_type=transition_type,
         outcome="success",
         message="test",
         commit_hash="abc123",
@@ -29,53 +62,37 @@ def make_result(n: int, transition_type: str = "coding") -> TurnResult:
     )
 
 
-def fake_claude_noop(tmp_path: Path) -> Path:
-    """Create a no-op fake claude CLI script. Returns bin dir for PATH injection."""
-    fake_bin = tmp_path / "fake_bin"
-    fake_bin.mkdir(exist_ok=True)
-    script = fake_bin / "claude"
-    script.write_text("""#!/bin/bash
-# Handle --version for Driver._check_environment()
-if [[ "$1" == "--version" ]]; then
-    echo "claude-fake 1.0.0"
-    exit 0
-fi
-echo "fake claude"
-exit 0
-""")
-    script.chmod(0o755)
-    return fake_bin
-
+@pytest.fixture(scope="session")
+def fake_claude_with_commit(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fake claude that commits with outcome: success in $AFK_TEST_REPO.
 
-def fake_claude_with_commit(tmp_path: Path, repo_path: Path) -> Path:
-    """Create fake claude that makes a commit with outcome: success. Returns bin dir."""
-    fake_bin = tmp_path / "fake_bin_commit"
-    fake_bin.mkdir(exist_ok=True)
+    Returns bin dir. Consumers must set AFK_TEST_REPO to the repo path.
+    """
+    fake_bin = tmp_path_factory.mktemp("fake_bin_commit")
     script = fake_bin / "claude"
-    script.write_text(f"""#!/bin/bash
+    script.write_text("""#!/bin/sh
 # Handle --version for Driver._check_environment()
-if [[ "$1" == "--version" ]]; then
+if [ "$1" = "--version" ]; then
     echo "claude-fake 1.0.0"
     exit 0
 fi
-cd {repo_path}
-git commit --allow-empty -m "feat: test commit
+# exec: git replaces the shell, so no extra process lingers until it exits
+exec git -C "$AFK_TEST_REPO" commit --allow-empty -q -m "feat: test commit
 
 outcome: success"
-exit 0
 """)
     script.chmod(0o755)
     return fake_bin
 
 
-def fake_claude_no_commit(tmp_path: Path) -> Path:
-    """Create fake claude that exits without making a commit. Returns bin dir."""
-    fake_bin = tmp_path / "fake_bin_no_commit"
-    fake_bin.mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def fake_claude_no_commit(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fake claude that exits without making a commit. Returns bin dir."""
+    fake_bin = tmp_path_factory.mktemp("fake_bin_no_commit")
     script = fake_bin / "claude"
-    script.write_text("""#!/bin/bash
+    script.write_text("""#!/bin/sh
 # Handle --version for Driver._check_environment()
-if [[ "$1" == "--version" ]]; then
+if [ "$1" = "--version" ]; then
     echo "claude-fake 1.0.0"
     exit 0
 fi
@@ -86,56 +103,78 @@ exit 0
     return fake_bin
 
 
+SessionEnvFactory = Callable[[Path, Path], tuple[Path, Driver, Git]]
+
+
 @pytest.fixture
-def session_env(
+def session_env_factory(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> SessionEnvFactory:
+    """Build a per-test repo from a template with the given fake claude on PATH.
+
+    Shared setup body for the session_env / execute_session / session_with_git
+    fixtures, which differ only in template and fake claude variant.
+    """
+
+    def make(template: Path, fake_bin: Path) -> tuple[Path, Driver, Git]:
+        repo = tmp_path / "repo"
+        shutil.copytree(template, repo)
+        monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
+        # Fake claude scripts that commit need to know where the repo is
+        monkeypatch.setenv("AFK_TEST_REPO", str(repo))
+        return repo, Driver(repo), Git(str(repo))
+
+    return make
+
+
+@pytest.fixture
+def session_env(
+    session_env_factory: SessionEnvFactory,
+    repo_template_with_commit: Path,
+    fake_claude_noop: Path,
 ) -> tuple[Path, Driver, Git]:
-    """Set up environment for Session tests with fake claude."""
-    # Create git repo
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    """Set up environment for Session tests with fake claude and an initial commit."""
+    return session_env_factory(repo_template_with_commit, fake_claude_noop)
+
 
-    # Inject fake claude into PATH
-    fake_bin = fake_claude_noop(tmp_path)
-    monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
+@pytest.fixture(scope="session")
+def shared_session_env(
+    shared_env_factory: Callable[..., tuple[Path, Driver, Git]], repo_template: Path
+) -> tuple[Path, Driver, Git]:
+    """Shared environment for tests that only exercise Session argument validation.
+
+    Built once per test session. Tests using it must not mutate the repo.
+    """
+    return shared_env_factory("shared_session", repo_template)
 
-    git = Git(str(repo))
-    driver = Driver(repo)
-    return repo, driver, git
+
+@pytest.fixture(scope="session")
+def shared_session(
+    shared_env_factory: Callable[..., tuple[Path, Driver, Git]],
+    repo_template_with_commit: Path,
+) -> Session:
+    """A Session named "my_session", constructed (and tagged) once per test session.
+
+    For tests that only read properties of a fresh Session. Tests using it
+    must not add turns or otherwise mutate it.
+    """
+    repo, driver, git = shared_env_factory(
+        "shared_session_tagged", repo_template_with_commit
+    )
+    return Session(repo, "my_session", driver, git)
 
 
 def make_session(
     root_dir: Path, driver: Driver, git: Git, name: str = "test_session"
 ) -> Session:
-    """Helper to create Session with default name, ensuring initial commit exists."""
-    if git.head_commit() is None:
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
+    """Helper to create Session with default name."""
     return Session(root_dir, name, driver, git)
 
 
 class TestSession:
-    def test_empty_session(self, session_env: tuple[Path, Driver, Git]) -> None:
+    def test_empty_session(self, shared_session: Session) -> None:
         """AC#4: Session can be instantiated and returns empty tuple of turns."""
-        root_dir, driver, git = session_env
-        session = make_session(root_dir, driver, git)
+        session = shared_session
         assert session.turns == ()
         assert list(session) == []
 
@@ -143,7 +182,7 @@ class TestSession:
         """AC#1: add_turn adds TurnResult to session."""
         root_dir, driver, git = session_env
         session = make_session(root_dir, driver, git)
-        result = make_result(1, "init")
+        result = make_result(1, TT_INIT)
         session.add_turn(result)
         assert session.turns == (result,)
 
@@ -153,9 +192,9 @@ class TestSession:
         """AC#1: TurnResults are stored in order of addition."""
         root_dir, driver, git = session_env
         session = make_session(root_dir, driver, git)
-        r1 = make_result(1, "init")
-        r2 = make_result(2, "coding")
-        r3 = make_result(3, "coding")
+        r1 = make_result(1, TT_INIT)
+        r2 = make_result(2, TT_CODING)
+        r3 = make_result(3, TT_CODING)
         session.add_turn(r1)
         session.add_turn(r2)
         session.add_turn(r3)
@@ -209,7 +248,7 @@ class TestSession:
         """First turn must have turn_number 1."""
         root_dir, driver, git = session_env
         session = make_session(root_dir, driver, git)
-        with pytest.raises(ValueError, match="First turn must be turn 1"):
+        with pytest.raises(ValueError, match=_FIRST_TURN_NOT_ONE):
             session.add_turn(make_result(5))  # Must start at 1
 
     def test_add_turn_requires_monotonic_increase(
@@ -220,7 +259,7 @@ class TestSession:
         session = make_session(root_dir, driver, git)
         session.add_turn(make_result(1))
         session.add_turn(make_result(5))  # Gap is fine
-        with pytest.raises(ValueError, match="must be > 5"):
+        with pytest.raises(ValueError, match=_MUST_BE_GT_5):
             session.add_turn(make_result(3))  # Going backwards - fails
 
     def test_add_turn_rejects_duplicate(
@@ -230,7 +269,7 @@ class TestSession:
         root_dir, driver, git = session_env
         session = make_session(root_dir, driver, git)
         session.add_turn(make_result(1))
-        with pytest.raises(ValueError, match="must be > 1"):
+        with pytest.raises(ValueError, match=_MUST_BE_GT_1):
             session.add_turn(make_result(1))  # Duplicate - fails
 
     def test_failed_add_doesnt_corrupt_state(
@@ -259,68 +298,66 @@ class TestSessionRootDir:
         session = make_session(root_dir, driver, git)
         assert session.root_dir == root_dir
 
-    def test_log_dir_returns_logs_subdirectory(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
+    def test_log_dir_returns_logs_subdirectory(self, shared_session: Session) -> None:
         """log_dir property returns root_dir / 'logs'."""
-        root_dir, driver, git = session_env
-        session = make_session(root_dir, driver, git)
-        assert session.log_dir == root_dir / "logs"
+        assert shared_session.log_dir == shared_session.root_dir / "logs"
 
-    def test_log_dir_is_absolute(self, session_env: tuple[Path, Driver, Git]) -> None:
+    def test_log_dir_is_absolute(self, shared_session: Session) -> None:
         """log_dir property returns an absolute path."""
-        root_dir, driver, git = session_env
-        session = make_session(root_dir, driver, git)
-        assert session.log_dir.is_absolute()
+        assert shared_session.log_dir.is_absolute()
 
 
 class TestSessionValidation:
     """Tests for Session input validation."""
 
     def test_rejects_string_root_dir(
-        self, session_env: tuple[Path, Driver, Git]
+        self, shared_session_env: tuple[Path, Driver, Git]
     ) -> None:
         """root_dir must be Path, not string."""
-        _, driver, git = session_env
-        with pytest.raises(TypeError, match="expected Path, got '/some/path'"):
+        _, driver, git = shared_session_env
+        with pytest.raises(TypeError, match=_EXPECTED_PATH):
             Session("/some/path", "test", driver, git)  # type: ignore[arg-type]
 
     def test_rejects_relative_root_dir(
-        self, session_env: tuple[Path, Driver, Git]
+        self, shared_session_env: tuple[Path, Driver, Git]
     ) -> None:
         """root_dir must be absolute."""
-        _, driver, git = session_env
-        with pytest.raises(ValueError, match="must be an absolute path"):
+        _, driver, git = shared_session_env
+        with pytest.raises(ValueError, match=_MUST_BE_ABSOLUTE):
             Session(Path("relative/path"), "test", driver, git)
 
     def test_rejects_nonexistent_root_dir(
-        self, session_env: tuple[Path, Driver, Git]
+        self, shared_session_env: tuple[Path, Driver, Git]
     ) -> None:
         """root_dir must be an existing directory."""
-        _, driver, git = session_env
-        with pytest.raises(ValueError, match="must be a directory"):
+        _, driver, git = shared_session_env
+        with pytest.raises(ValueError, match=_MUST_BE_DIRECTORY):
             Session(Path("/nonexistent/path"), "test", driver, git)
 
     def test_rejects_file_as_root_dir(
-        self, tmp_path: Path, session_env: tuple[Path, Driver, Git]
+        self, tmp_path: Path, shared_session_env: tuple[Path, Driver, Git]
     ) -> None:
         """root_dir must be a directory, not a file."""
-        _, driver, git = session_env
+        _, driver, git = shared_session_env
         file_path = tmp_path / "somefile.txt"
         file_path.write_text("content")
-        with pytest.raises(ValueError, match="must be a directory"):
+        with pytest.raises(ValueError, match=_MUST_BE_DIRECTORY):
             Session(file_path, "test", driver, git)
 
-    def test_rejects_non_driver(self, session_env: tuple[Path, Driver, Git]) -> None:
+    def test_rejects_non_driver(
+        self, shared_session_env: tuple[Path, Driver, Git]
+    ) -> None:
         """driver must be Driver instance."""
-        root_dir, _, git = session_env
-        with pytest.raises(TypeError, match="expected Driver, got 'not a driver'"):
+        root_dir, _, git = shared_session_env
+        with pytest.raises(TypeError, match=_EXPECTED_DRIVER):
             Session(root_dir, "test", "not a driver", git)  # type: ignore[arg-type]
 
-    def test_rejects_non_git(self, session_env: tuple[Path, Driver, Git]) -> None:
+    def test_rejects_non_git(
+        self, shared_session_env: tuple[Path, Driver, Git]
+    ) -> None:
         """git must be Git instance."""
-        root_dir, driver, _ = session_env
-        with pytest.raises(TypeError, match="expected Git, got 'not a git'"):
+        root_dir, driver, _ = shared_session_env
+        with pytest.raises(TypeError, match=_EXPECTED_GIT):
             Session(root_dir, "test", driver, "not a git")  # type: ignore[arg-type]
 
     def test_rejects_non_turn_result_in_add_turn(
@@ -329,75 +366,33 @@ class TestSessionValidation:
         """add_turn rejects non-TurnResult values."""
         root_dir, driver, git = session_env
         session = make_session(root_dir, driver, git)
-        with pytest.raises(TypeError, match="expected TurnResult, got 'not a result'"):
+        with pytest.raises(TypeError, match=_EXPECTED_TURN_RESULT):
             session.add_turn("not a result")  # type: ignore[arg-type]
 
 
 @pytest.fixture
-def execute_session(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Session:
+def execute_session(
+    session_env_factory: SessionEnvFactory,
+    repo_template_with_commit: Path,
+    fake_claude_with_commit: Path,
+) -> Session:
     """Set up a Session with fake claude that makes commits."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    repo, driver, git = session_env_factory(
+        repo_template_with_commit, fake_claude_with_commit
     )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "--allow-empty", "-m", "initial"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    fake_bin = fake_claude_with_commit(tmp_path, repo)
-    monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
-
-    git = Git(str(repo))
-    driver = Driver(repo)
     return Session(repo, "execute_test", driver, git)
 
 
 @pytest.fixture
 def execute_session_no_commit(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    session_env_factory: SessionEnvFactory,
+    repo_template_with_commit: Path,
+    fake_claude_no_commit: Path,
 ) -> Session:
     """Set up a Session with fake claude that does NOT make commits."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "--allow-empty", "-m", "initial"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
+    repo, driver, git = session_env_factory(
+        repo_template_with_commit, fake_claude_no_commit
     )
-
-    fake_bin = fake_claude_no_commit(tmp_path)
-    monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
-
-    git = Git(str(repo))
-    driver = Driver(repo)
     return Session(repo, "no_commit_test", driver, git)
 
 
@@ -406,28 +401,28 @@ class TestSessionExecuteTurn:
 
     def test_creates_turn_with_correct_number(self, execute_session: Session) -> None:
         """AC#1: execute_turn creates TurnResult with correct turn_number."""
-        result = execute_session.execute_turn("test prompt", TransitionType("init"))
+        result = execute_session.execute_turn("test prompt", TT_INIT)
 
         assert result.turn_number == 1
         assert result.outcome == "success"
 
     def test_turn_has_correct_transition_type(self, execute_session: Session) -> None:
         """AC#1: execute_turn creates TurnResult with correct transition_type."""
-        transition_type = TransitionType("coding")
+        transition_type = TT_CODING
         result = execute_session.execute_turn("test prompt", transition_type)
 
         assert result.transition_type == transition_type
 
     def test_turn_has_correct_log_file_path(self, execute_session: Session) -> None:
         """AC#1: execute_turn creates TurnResult with log_file following TurnLog pattern."""
-        result = execute_session.execute_turn("test prompt", TransitionType("init"))
+        result = execute_session.execute_turn("test prompt", TT_INIT)
 
         assert result.log_file.name == "turn-00001-init.log"
         assert result.log_file.parent == execute_session.log_dir
 
     def test_turn_is_added_to_session(self, execute_session: Session) -> None:
         """AC#1: execute_turn adds TurnResult to session."""
-        result = execute_session.execute_turn("test prompt", TransitionType("init"))
+        result = execute_session.execute_turn("test prompt", TT_INIT)
 
         assert len(execute_session) == 1
         assert execute_session[1] is result
@@ -436,9 +431,9 @@ class TestSessionExecuteTurn:
         self, execute_session: Session
     ) -> None:
         """AC#1: Sequential execute_turn calls increment turn_number."""
-        r1 = execute_session.execute_turn("prompt 1", TransitionType("init"))
-        r2 = execute_session.execute_turn("prompt 2", TransitionType("coding"))
-        r3 = execute_session.execute_turn("prompt 3", TransitionType("coding"))
+        r1 = execute_session.execute_turn("prompt 1", TT_INIT)
+        r2 = execute_session.execute_turn("prompt 2", TT_CODING)
+        r3 = execute_session.execute_turn("prompt 3", TT_CODING)
 
         assert r1.turn_number == 1
         assert r2.turn_number == 2
@@ -448,10 +443,8 @@ class TestSessionExecuteTurn:
         self, execute_session_no_commit: Session
     ) -> None:
         """Failed execution does not create a TurnResult - no commit means no Turn."""
-        with pytest.raises(RuntimeError, match="No commit"):
-            execute_session_no_commit.execute_turn(
-                "test prompt", TransitionType("init")
-            )
+        with pytest.raises(RuntimeError, match=_NO_COMMIT):
+            execute_session_no_commit.execute_turn("test prompt", TT_INIT)
 
         assert len(execute_session_no_commit) == 0
 
@@ -461,7 +454,7 @@ class TestSessionLogging:
 
     def test_successful_turn_logs_start_and_end(self, execute_session: Session) -> None:
         """Successful execute_turn logs start and end markers with outcome."""
-        result = execute_session.execute_turn("test prompt", TransitionType("init"))
+        result = execute_session.execute_turn("test prompt", TT_INIT)
 
         log_content = result.log_file.read_text()
         assert "=== Turn 1 START ===" in log_content
@@ -473,10 +466,8 @@ class TestSessionLogging:
         """Failed execute_turn logs start and abort with traceback."""
         log_file = execute_session_no_commit.log_dir / "turn-00001-init.log"
 
-        with pytest.raises(RuntimeError, match="No commit"):
-            execute_session_no_commit.execute_turn(
-                "test prompt", TransitionType("init")
-            )
+        with pytest.raises(RuntimeError, match=_NO_COMMIT):
+            execute_session_no_commit.execute_turn("test prompt", TT_INIT)
 
         log_content = log_file.read_text()
         assert "=== Turn 1 START ===" in log_content
@@ -487,8 +478,8 @@ class TestSessionLogging:
         self, execute_session: Session
     ) -> None:
         """Multiple successful turns log with correct turn numbers."""
-        r1 = execute_session.execute_turn("prompt 1", TransitionType("init"))
-        r2 = execute_session.execute_turn("prompt 2", TransitionType("coding"))
+        r1 = execute_session.execute_turn("prompt 1", TT_INIT)
+        r2 = execute_session.execute_turn("prompt 2", TT_CODING)
 
         log1_content = r1.log_file.read_text()
         log2_content = r2.log_file.read_text()
@@ -519,37 +510,29 @@ class TestSessionAllocateTurnNumber:
 
 @pytest.fixture
 def session_with_git(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    session_env_factory: SessionEnvFactory,
+    repo_template_with_commit: Path,
+    fake_claude_noop: Path,
 ) -> tuple[Session, Git, Driver, Path]:
     """Create a Session with git repo for testing build_turn_result."""
-    repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+    # Template has an initial commit so Session can be created
+    repo, driver, git = session_env_factory(repo_template_with_commit, fake_claude_noop)
+    session = Session(repo, "build_test", driver, git)
+    return session, git, driver, repo
 
-    fake_bin = fake_claude_noop(tmp_path)
-    monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
 
-    git = Git(str(repo))
-    driver = Driver(repo)
-    # Create initial commit so Session can be created
-    subprocess.run(
-        ["git", "commit", "--allow-empty", "-m", "initial"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
+@pytest.fixture(scope="class")
+def class_session_with_git(
+    shared_env_factory: Callable[..., tuple[Path, Driver, Git]],
+    repo_template_with_commit: Path,
+) -> tuple[Session, Git, Driver, Path]:
+    """Session with git repo shared by all tests of one build_turn_result class.
+
+    Sharing is safe for tests that only add commits on top of HEAD: each Turn
+    captures its own head_before. Tests that move HEAD elsewhere (orphan
+    branches) use the function-scoped session_with_git instead.
+    """
+    repo, driver, git = shared_env_factory("build_test", repo_template_with_commit)
     session = Session(repo, "build_test", driver, git)
     return session, git, driver, repo
 
@@ -557,32 +540,38 @@ def session_with_git(
 def make_turn(driver: Driver, git: Git, repo: Path) -> Turn:
     """Create and start a Turn, capturing current HEAD."""
     turn = Turn(driver, git, repo)
-    turn.start(1, TransitionType("test"))
+    turn.start(1, TT_TEST)
     return turn
 
 
-def make_commit(git: Git, message: str) -> str:
-    """Helper to create a commit and return its hash."""
-    repo_path = Path(git.repo_path)
-    filename = f"file_{uuid.uuid4().hex[:8]}.txt"
-    (repo_path / filename).write_text(f"commit: {message}")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+def make_commit(git: Git, message: str) -> None:
+    """Helper to create a commit on HEAD, as the agent would during a turn."""
+    # Empty commit: build_turn_result only inspects history, not file contents
     subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=repo_path,
+        ["git", "commit", "--allow-empty", "-q", "-m", message],
+        cwd=git.repo_path,
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    commit_hash = git.head_commit()
-    assert commit_hash is not None
-    return commit_hash
+
+
+def resolve_tags(repo: Path, *tags: str) -> list[str]:
+    """Resolve tags to commit hashes with a single `git rev-parse` call."""
+    return subprocess.run(
+        ["git", "rev-parse", *tags],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
 
 
 class TestBuildTurnResultWithOneCommit:
     def test_returns_result_with_single_commit(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         # Fixture already has initial commit, so we can start a turn
         turn = make_turn(driver, git, repo)
 
@@ -595,9 +584,9 @@ class TestBuildTurnResultWithOneCommit:
         assert len(result.commit_hash) >= 40
 
     def test_extracts_outcome_from_commit_message(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         make_commit(git, "fix: bug fix\n\noutcome: failure")
@@ -610,9 +599,9 @@ class TestBuildTurnResultWithOneCommit:
 
 class TestBuildTurnResultEdgeCases:
     def test_outcome_none_when_not_in_message(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         make_commit(git, "chore: update deps")
@@ -623,12 +612,12 @@ class TestBuildTurnResultEdgeCases:
         assert "chore: update deps" in result.message
 
     def test_raises_on_nonzero_exit_code(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
-        with pytest.raises(RuntimeError, match="Exit code: 1"):
+        with pytest.raises(RuntimeError, match=_EXIT_CODE_1):
             session.build_turn_result(turn, exit_code=1)
 
 
@@ -636,9 +625,9 @@ class TestBuildTurnResultZeroCommitsError:
     """Tests for zero commits error message content."""
 
     def test_zero_commits_error_says_no_commit_detected(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -647,9 +636,9 @@ class TestBuildTurnResultZeroCommitsError:
         assert "No commit at end of turn" in str(exc_info.value)
 
     def test_zero_commits_error_includes_head(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         head = git.head_commit()  # Get current HEAD from fixture
         turn = make_turn(driver, git, repo)
 
@@ -661,9 +650,9 @@ class TestBuildTurnResultZeroCommitsError:
         assert head[:7] in error_msg  # type: ignore[index]
 
     def test_zero_commits_error_includes_log_file_path(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -676,9 +665,9 @@ class TestBuildTurnResultMultipleCommitsError:
     """Tests for multiple commits error message content."""
 
     def test_multiple_commits_error_says_multiple_detected(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         make_commit(git, "feat: first\n\noutcome: success")
@@ -690,9 +679,9 @@ class TestBuildTurnResultMultipleCommitsError:
         assert "Multiple commits detected" in str(exc_info.value)
 
     def test_multiple_commits_error_lists_hashes_and_subjects(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         make_commit(git, "feat: first change")
@@ -710,9 +699,9 @@ class TestBuildTurnResultNonZeroExitError:
     """Tests for non-zero exit code error message content."""
 
     def test_nonzero_exit_includes_exit_code(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -723,9 +712,9 @@ class TestBuildTurnResultNonZeroExitError:
         assert "exit" in error_msg.lower()
 
     def test_nonzero_exit_includes_log_file_path(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -738,9 +727,9 @@ class TestBuildTurnResultSignalError:
     """Tests for signal termination error message content."""
 
     def test_signal_termination_detected(
-        self, session_with_git: tuple[Session, Git, Driver, Path]
+        self, class_session_with_git: tuple[Session, Git, Driver, Path]
     ) -> None:
-        session, git, driver, repo = session_with_git
+        session, git, driver, repo = class_session_with_git
         turn = make_turn(driver, git, repo)
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -760,20 +749,21 @@ class TestBuildTurnResultAncestryMismatchError:
         session, git, driver, repo = session_with_git
         turn = make_turn(driver, git, repo)
 
-        # Simulate agent switching to orphan branch
+        # Simulate agent switching to orphan branch: pointing HEAD at an unborn
+        # branch is all `git checkout --orphan` does here, the index is empty
         subprocess.run(
-            ["git", "checkout", "--orphan", "orphan"],
+            ["git", "symbolic-ref", "HEAD", "refs/heads/orphan"],
             cwd=repo,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        (repo / "orphan.txt").write_text("orphan content")
-        subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
         subprocess.run(
-            ["git", "commit", "-m", "orphan commit"],
+            ["git", "commit", "--allow-empty", "-q", "-m", "orphan commit"],
             cwd=repo,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -792,71 +782,35 @@ class TestBuildTurnResultAncestryMismatchError:
 class TestSessionNameValidation:
     """Tests for Session name parameter validation."""
 
-    def test_rejects_empty_name(self, session_env: tuple[Path, Driver, Git]) -> None:
-        """Session rejects empty name."""
-        root_dir, driver, git = session_env
-        with pytest.raises(ValueError, match="cannot be empty"):
-            Session(root_dir, "", driver, git)
-
-    def test_rejects_name_with_spaces(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """Session rejects name with spaces."""
-        root_dir, driver, git = session_env
-        with pytest.raises(ValueError, match="alphanumerics and underscores"):
-            Session(root_dir, "my session", driver, git)
-
-    def test_rejects_name_with_colon(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """Session rejects name with special characters like colon."""
-        root_dir, driver, git = session_env
-        with pytest.raises(ValueError, match="alphanumerics and underscores"):
-            Session(root_dir, "test:1", driver, git)
-
-    def test_rejects_name_with_hyphen(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """Session rejects name with hyphen."""
-        root_dir, driver, git = session_env
-        with pytest.raises(ValueError, match="alphanumerics and underscores"):
-            Session(root_dir, "test-1", driver, git)
-
-    def test_rejects_name_with_dot(self, session_env: tuple[Path, Driver, Git]) -> None:
-        """Session rejects name with dot."""
-        root_dir, driver, git = session_env
-        with pytest.raises(ValueError, match="alphanumerics and underscores"):
-            Session(root_dir, "test.1", driver, git)
-
-    def test_rejects_name_longer_than_64_chars(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """Session rejects name longer than 64 characters."""
-        root_dir, driver, git = session_env
-        long_name = "a" * 65
-        with pytest.raises(ValueError, match="cannot exceed 64 characters"):
-            Session(root_dir, long_name, driver, git)
-
-    def test_rejects_non_string_name(
-        self, session_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """Session rejects non-string name."""
-        root_dir, driver, git = session_env
-        with pytest.raises(TypeError, match="expected str"):
-            Session(root_dir, 123, driver, git)  # type: ignore[arg-type]
+    @pytest.mark.parametrize(
+        ("name", "error", "match"),
+        [
+            pytest.param("", ValueError, _NAME_EMPTY, id="empty"),
+            pytest.param("my session", ValueError, _NAME_CHARSET, id="space"),
+            pytest.param("test:1", ValueError, _NAME_CHARSET, id="colon"),
+            pytest.param("test-1", ValueError, _NAME_CHARSET, id="hyphen"),
+            pytest.param("test.1", ValueError, _NAME_CHARSET, id="dot"),
+            pytest.param("a" * 65, ValueError, _NAME_TOO_LONG, id="too_long"),
+            pytest.param(123, TypeError, _EXPECTED_STR, id="not_str"),
+        ],
+    )
+    def test_rejects_invalid_name(
+        self,
+        name: object,
+        error: type[Exception],
+        match: re.Pattern[str],
+        shared_session_env: tuple[Path, Driver, Git],
+    ) -> None:
+        """Session rejects empty, non-string, over-long, and non-[A-Za-z0-9_] names."""
+        root_dir, driver, git = shared_session_env
+        with pytest.raises(error, match=match):
+            Session(root_dir, name, driver, git)  # type: ignore[arg-type]
 
     def test_accepts_valid_alphanumeric_name(
         self, session_env: tuple[Path, Driver, Git]
     ) -> None:
         """Session accepts valid alphanumeric name."""
         root_dir, driver, git = session_env
-        # Need an initial commit for session to work
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
         session = Session(root_dir, "test_session_123", driver, git)
         assert session.name == "test_session_123"
 
@@ -865,12 +819,6 @@ class TestSessionNameValidation:
     ) -> None:
         """Session accepts name exactly 64 characters."""
         root_dir, driver, git = session_env
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
         max_name = "a" * 64
         session = Session(root_dir, max_name, driver, git)
         assert session.name == max_name
@@ -880,14 +828,16 @@ class TestSessionWorkspaceInitialization:
     """Tests for Session workspace initialization and tagging."""
 
     def test_empty_directory_initializes_git_repo(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_claude_noop: Path,
     ) -> None:
         """Empty directory should be initialized as git repo with empty commit."""
         repo = tmp_path / "empty_repo"
         repo.mkdir()
 
-        fake_bin = fake_claude_noop(tmp_path)
-        monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
+        monkeypatch.setenv("PATH", f"{fake_claude_noop}:{os.environ['PATH']}")
 
         # No git init - directory is empty and not a repo
         git = Git(str(repo))
@@ -901,20 +851,19 @@ class TestSessionWorkspaceInitialization:
         assert session.name == "test_session"
 
     def test_non_empty_directory_not_git_repo_raises(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_claude_noop: Path
     ) -> None:
         """Non-empty directory that is not a git repo should raise RuntimeError."""
         repo = tmp_path / "non_empty"
         repo.mkdir()
         (repo / "somefile.txt").write_text("content")
 
-        fake_bin = fake_claude_noop(tmp_path)
-        monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
+        monkeypatch.setenv("PATH", f"{fake_claude_noop}:{os.environ['PATH']}")
 
         git = Git(str(repo))
         driver = Driver(repo)
 
-        with pytest.raises(RuntimeError, match="not a git repo and not empty"):
+        with pytest.raises(RuntimeError, match=_NOT_REPO_NOT_EMPTY):
             Session(repo, "test_session", driver, git)
 
     def test_git_repo_with_commits_tags_head(
@@ -922,12 +871,6 @@ class TestSessionWorkspaceInitialization:
     ) -> None:
         """Existing git repo with commits should tag HEAD as afk-{name}-0."""
         root_dir, driver, git = session_env
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
         head_before = git.head_commit()
 
         session = Session(root_dir, "experiment1", driver, git)
@@ -935,79 +878,41 @@ class TestSessionWorkspaceInitialization:
         assert session.name == "experiment1"
         assert git.tag_exists("afk-experiment1-0")
         # Tag should point to HEAD at session creation
-        tag_commit = subprocess.run(
-            ["git", "rev-parse", "afk-experiment1-0"],
-            cwd=root_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
-        assert tag_commit == head_before
+        assert resolve_tags(root_dir, "afk-experiment1-0") == [head_before]
 
     def test_duplicate_session_name_fails(
         self, session_env: tuple[Path, Driver, Git]
     ) -> None:
         """Second session with same name should fail (tag-0 already exists)."""
         root_dir, driver, git = session_env
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
 
         # First session - should succeed
         Session(root_dir, "experiment", driver, git)
 
         # Second session with same name - should fail
-        with pytest.raises(RuntimeError, match="Tag already exists"):
+        with pytest.raises(RuntimeError, match=_TAG_EXISTS):
             Session(root_dir, "experiment", driver, git)
 
     def test_empty_repo_after_init_raises(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        session_env_factory: SessionEnvFactory,
+        repo_template: Path,
+        fake_claude_noop: Path,
     ) -> None:
         """Git repo with no commits (unborn HEAD) should raise RuntimeError."""
-        repo = tmp_path / "empty_git_repo"
-        repo.mkdir()
-        subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
-        )
-
-        fake_bin = fake_claude_noop(tmp_path)
-        monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
-
-        git = Git(str(repo))
-        driver = Driver(repo)
+        repo, driver, git = session_env_factory(repo_template, fake_claude_noop)
 
         # Already a git repo but no commits - should raise
-        with pytest.raises(RuntimeError, match="requires at least one commit"):
+        with pytest.raises(RuntimeError, match=_NEEDS_COMMIT):
             Session(repo, "test_session", driver, git)
 
 
 class TestSessionRepr:
     """Tests for Session __repr__ with name."""
 
-    def test_repr_includes_name(self, session_env: tuple[Path, Driver, Git]) -> None:
+    def test_repr_includes_name(self, shared_session: Session) -> None:
         """Session __repr__ should include the name."""
-        root_dir, driver, git = session_env
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=root_dir,
-            check=True,
-            capture_output=True,
-        )
-        session = Session(root_dir, "my_session", driver, git)
-        repr_str = repr(session)
+        repr_str = repr(shared_session)
         assert "my_session" in repr_str
         assert "Session" in repr_str
 
@@ -1024,29 +929,23 @@ class TestSessionTurnTagging:
         self, execute_session: Session
     ) -> None:
         """execute_turn() creates tag afk-{name}-{turn_number} after turn completion."""
-        result = execute_session.execute_turn("test prompt", TransitionType("init"))
+        result = execute_session.execute_turn("test prompt", TT_INIT)
 
         # Session name is "execute_test", turn number is 1
         git = Git(str(execute_session.root_dir))
         assert git.tag_exists("afk-execute_test-1")
 
         # Verify tag points to the correct commit
-        tag_commit = subprocess.run(
-            ["git", "rev-parse", "afk-execute_test-1"],
-            cwd=execute_session.root_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        ).stdout.strip()
-        assert tag_commit == result.commit_hash
+        tag_commits = resolve_tags(execute_session.root_dir, "afk-execute_test-1")
+        assert tag_commits == [result.commit_hash]
 
     def test_execute_turn_creates_sequential_tags(
         self, execute_session: Session
     ) -> None:
         """Sequential execute_turn() calls create tags with incrementing numbers."""
-        r1 = execute_session.execute_turn("prompt 1", TransitionType("init"))
-        r2 = execute_session.execute_turn("prompt 2", TransitionType("coding"))
-        r3 = execute_session.execute_turn("prompt 3", TransitionType("coding"))
+        r1 = execute_session.execute_turn("prompt 1", TT_INIT)
+        r2 = execute_session.execute_turn("prompt 2", TT_CODING)
+        r3 = execute_session.execute_turn("prompt 3", TT_CODING)
 
         git = Git(str(execute_session.root_dir))
         assert git.tag_exists("afk-execute_test-1")
@@ -1054,64 +953,35 @@ class TestSessionTurnTagging:
         assert git.tag_exists("afk-execute_test-3")
 
         # Verify tags point to correct commits
-        for i, result in enumerate([r1, r2, r3], start=1):
-            tag_commit = subprocess.run(
-                ["git", "rev-parse", f"afk-execute_test-{i}"],
-                cwd=execute_session.root_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            ).stdout.strip()
-            assert tag_commit == result.commit_hash
+        tags = [f"afk-execute_test-{i}" for i in (1, 2, 3)]
+        tag_commits = resolve_tags(execute_session.root_dir, *tags)
+        assert tag_commits == [r1.commit_hash, r2.commit_hash, r3.commit_hash]
 
     def test_preexisting_tag_causes_immediate_error(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        session_env_factory: SessionEnvFactory,
+        repo_template_with_commit: Path,
+        fake_claude_with_commit: Path,
     ) -> None:
         """Pre-existing tag causes RuntimeError BEFORE turn.start()."""
-        # Set up repo
-        repo = tmp_path / "repo"
-        repo.mkdir()
-        subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
+        repo, driver, git = session_env_factory(
+            repo_template_with_commit, fake_claude_with_commit
         )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "--allow-empty", "-m", "initial"],
-            cwd=repo,
-            check=True,
-            capture_output=True,
-        )
-
-        fake_bin = fake_claude_with_commit(tmp_path, repo)
-        monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
-
-        git = Git(str(repo))
-        driver = Driver(repo)
         session = Session(repo, "collision_test", driver, git)
 
         # Pre-create the tag that would be used for turn 1
         head = git.head_commit()
         subprocess.run(
-            ["git", "tag", "afk-collision_test-1", head],
+            ["git", "update-ref", "refs/tags/afk-collision_test-1", head],
             cwd=repo,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # execute_turn should fail immediately (before turn.start())
-        with pytest.raises(
-            RuntimeError, match="Tag already exists.*afk-collision_test-1"
-        ):
-            session.execute_turn("test prompt", TransitionType("init"))
+        with pytest.raises(RuntimeError, match=_TURN_1_TAG_EXISTS):
+            session.execute_turn("test prompt", TT_INIT)
 
         # No turn should have been recorded (failed before execution)
         assert len(session) == 0
@@ -42,50 +42,24 @@ class TestTransitionTypeCreation:
 class TestTransitionTypeValidation:
     """Tests for TransitionType input validation."""
 
-    def test_rejects_empty_string(self) -> None:
-        """Empty transition type raises ValueError."""
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("Coding", id="uppercase"),
+            pytest.param("2step", id="leading_digit"),
+            pytest.param(".hidden", id="leading_dot"),
+            pytest.param("-verbose", id="leading_hyphen"),
+            pytest.param("code review", id="whitespace"),
+            pytest.param("foo/bar", id="forward_slash"),
+            pytest.param("foo\\bar", id="backslash"),
+            pytest.param("$var", id="dollar_sign"),
+        ],
+    )
+    def test_rejects_invalid_value(self, value: str) -> None:
+        """Values not matching the transition type pattern raise ValueError."""
         with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("")
-
-    def test_rejects_uppercase(self) -> None:
-        """Transition type with uppercase raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("Coding")
-
-    def test_rejects_leading_digit(self) -> None:
-        """Transition type starting with digit raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("2step")
-
-    def test_rejects_leading_dot(self) -> None:
-        """Transition type starting with dot raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType(".hidden")
-
-    def test_rejects_leading_hyphen(self) -> None:
-        """Transition type starting with hyphen raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("-verbose")
-
-    def test_rejects_whitespace(self) -> None:
-        """Transition type with whitespace raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("code review")
-
-    def test_rejects_forward_slash(self) -> None:
-        """Transition type with forward slash raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("foo/bar")
-
-    def test_rejects_backslash(self) -> None:
-        """Transition type with backslash raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("foo\\bar")
-
-    def test_rejects_dollar_sign(self) -> None:
-        """Transition type with dollar sign raises ValueError."""
-        with pytest.raises(ValueError, match="must match pattern"):
-            TransitionType("$var")
+            TransitionType(value)
 
     def test_rejects_none(self) -> None:
         """None raises TypeError with clear message."""
@@ -1,8 +1,10 @@
 import os
-import subprocess
+import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from afk.driver import Driver
 from afk.git import Git
@@ -10,65 +12,62 @@ from afk.transition_type import TransitionType
 from afk.turn import Turn, TurnState
 
 
-def fake_claude_noop(tmp_path: Path) -> Path:
-    """Create a no-op fake claude CLI script. Returns bin dir for PATH injection."""
-    fake_bin = tmp_path / "fake_bin"
-    fake_bin.mkdir(exist_ok=True)
-    script = fake_bin / "claude"
-    script.write_text("""#!/bin/bash
-# Handle --version for Driver._check_environment()
-if [[ "$1" == "--version" ]]; then
-    echo "claude-fake 1.0.0"
-    exit 0
-fi
-echo "fake claude"
-exit 0
-""")
-    script.chmod(0o755)
-    return fake_bin
+def _link_objects(template: Path) -> Callable[[str, str], None]:
+    """copytree copy_function for template: hardlink git objects, copy the rest.
+
+    Objects are immutable once written, so copies can share them. Other files
+    may be rewritten in place (git appends to reflogs), so those are copied.
+    Decided on the path relative to template, so ancestors of the temp root
+    named "objects" don't matter.
+    """
+
+    def copy(src: str, dst: str) -> None:
+        if Path(src).relative_to(template).parts[:2] == (".git", "objects"):
+            os.link(src, dst)
+        else:
+            shutil.copy2(src, dst)
+
+    return copy
 
 
 @pytest.fixture
 def turn_env(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    repo_template_with_commit: Path,
+    fake_claude_noop: Path,
 ) -> tuple[Path, Driver, Git]:
     """Set up environment for Turn tests with fake claude."""
     repo = tmp_path / "repo"
-    repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "commit", "--allow-empty", "-m", "initial"],
-        cwd=repo,
-        check=True,
-        capture_output=True,
-    )
-
-    fake_bin = fake_claude_noop(tmp_path)
-    monkeypatch.setenv("PATH", f"{fake_bin}:{os.environ['PATH']}")
+    template = repo_template_with_commit
+    shutil.copytree(template, repo, copy_function=_link_objects(template))
+
+    monkeypatch.setenv("PATH", f"{fake_claude_noop}:{os.environ['PATH']}")
 
     git = Git(str(repo))
     driver = Driver(repo)
     return repo, driver, git
 
 
+@pytest.fixture(scope="session")
+def shared_turn_env(
+    shared_env_factory: Callable[..., tuple[Path, Driver, Git]],
+) -> tuple[Path, Driver, Git]:
+    """Environment for Turn tests that never start a turn, built once.
+
+    Rejected calls fail before reading HEAD or writing logs, so the directory
+    is not even a git repo. Tests using it must not call a start() that would
+    succeed.
+    """
+    return shared_env_factory("shared_turn", None)
+
+
 class TestTurnStateMachine:
     def test_turn_starts_in_initial_state(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """New Turn starts in INITIAL state."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
         assert turn.state == TurnState.INITIAL
 
@@ -84,35 +83,21 @@ class TestTurnStateMachine:
         assert turn1.number == 1
         assert turn2.number == 2
 
-    def test_start_transitions_to_in_progress(
-        self, turn_env: tuple[Path, Driver, Git]
+    @pytest.mark.parametrize("transition", ["init", "coding"])
+    def test_start_side_effects(
+        self, transition: str, turn_env: tuple[Path, Driver, Git]
     ) -> None:
-        """start() transitions from INITIAL to IN_PROGRESS."""
-        root_dir, driver, git = turn_env
-        turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("coding"))
-        assert turn.state == TurnState.IN_PROGRESS
-
-    def test_start_creates_log_file(self, turn_env: tuple[Path, Driver, Git]) -> None:
-        """start() creates the log file with START marker."""
+        """start() moves to IN_PROGRESS, captures HEAD, and logs a START marker."""
         root_dir, driver, git = turn_env
         turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("init"))
-
-        assert turn.log_file.exists()
-        content = turn.log_file.read_text()
-        assert "=== Turn 1 START ===" in content
-
-    def test_start_captures_head_before(
-        self, turn_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """start() captures HEAD for later validation."""
-        root_dir, driver, git = turn_env
-        turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("coding"))
+        turn.start(1, TransitionType(transition))
 
+        assert turn.state == TurnState.IN_PROGRESS
         assert turn.head_before is not None
         assert len(turn.head_before) == 40  # SHA-1 hash
+        assert turn.log_file.exists()
+        assert transition in turn.log_file.name
+        assert "=== Turn 1 START ===" in turn.log_file.read_text()
 
     def test_cannot_start_twice(self, turn_env: tuple[Path, Driver, Git]) -> None:
         """start() raises if Turn is not in INITIAL state."""
@@ -124,10 +109,10 @@ class TestTurnStateMachine:
             turn.start(2, TransitionType("coding"))
 
     def test_execute_requires_in_progress(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """execute() raises if Turn is not in IN_PROGRESS state."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
 
         with pytest.raises(RuntimeError, match="Cannot execute.*INITIAL"):
@@ -144,16 +129,15 @@ class TestTurnStateMachine:
         exit_code = turn.execute("test prompt")
         assert exit_code == 0
 
-    def test_finish_transitions_to_finished(
-        self, turn_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """finish() transitions from IN_PROGRESS to FINISHED."""
+    def test_finish_side_effects(self, turn_env: tuple[Path, Driver, Git]) -> None:
+        """finish() moves from IN_PROGRESS to FINISHED and logs an END marker."""
         root_dir, driver, git = turn_env
         turn = Turn(driver, git, root_dir)
         turn.start(1, TransitionType("coding"))
 
         turn.finish("success", "abc123", "test message")
         assert turn.state == TurnState.FINISHED
+        assert "=== Turn 1 END: success ===" in turn.log_file.read_text()
 
     def test_finish_returns_turn_result(
         self, turn_env: tuple[Path, Driver, Git]
@@ -172,67 +156,37 @@ class TestTurnStateMachine:
         assert result.message == "test message"
         assert result.log_file == turn.log_file
 
-    def test_finish_logs_end_marker(self, turn_env: tuple[Path, Driver, Git]) -> None:
-        """finish() writes END marker to log."""
-        root_dir, driver, git = turn_env
-        turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("coding"))
-        turn.finish("success", "abc123", "test message")
-
-        content = turn.log_file.read_text()
-        assert "=== Turn 1 END: success ===" in content
-
     def test_finish_requires_in_progress(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """finish() raises if Turn is not in IN_PROGRESS state."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
 
         with pytest.raises(RuntimeError, match="Cannot finish.*INITIAL"):
             turn.finish("success", "abc123", "test message")
 
-    def test_abort_transitions_to_aborted(
-        self, turn_env: tuple[Path, Driver, Git]
-    ) -> None:
-        """abort() transitions from IN_PROGRESS to ABORTED."""
+    def test_abort_side_effects(self, turn_env: tuple[Path, Driver, Git]) -> None:
+        """abort() re-raises the error, moves to ABORTED, and logs an ABORT marker."""
         root_dir, driver, git = turn_env
         turn = Turn(driver, git, root_dir)
         turn.start(1, TransitionType("coding"))
 
-        with pytest.raises(RuntimeError, match="test error"):
-            turn.abort(RuntimeError("test error"))
+        original_error = ValueError("something failed")
+        with pytest.raises(ValueError) as exc_info:
+            turn.abort(original_error)
 
+        assert exc_info.value is original_error
         assert turn.state == TurnState.ABORTED
-
-    def test_abort_logs_abort_marker(self, turn_env: tuple[Path, Driver, Git]) -> None:
-        """abort() writes ABORT marker to log."""
-        root_dir, driver, git = turn_env
-        turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("coding"))
-
-        with pytest.raises(RuntimeError):
-            turn.abort(RuntimeError("something failed"))
-
         content = turn.log_file.read_text()
-        assert "=== Turn 1 ABORT: RuntimeError ===" in content
+        assert "=== Turn 1 ABORT: ValueError ===" in content
         assert "something failed" in content
 
-    def test_abort_reraises_exception(self, turn_env: tuple[Path, Driver, Git]) -> None:
-        """abort() re-raises the passed exception."""
-        root_dir, driver, git = turn_env
-        turn = Turn(driver, git, root_dir)
-        turn.start(1, TransitionType("coding"))
-
-        original_error = ValueError("original error")
-        with pytest.raises(ValueError, match="original error"):
-            turn.abort(original_error)
-
     def test_abort_requires_in_progress(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """abort() raises if Turn is not in IN_PROGRESS state."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
 
         with pytest.raises(RuntimeError, match="Cannot abort.*INITIAL"):
@@ -240,66 +194,68 @@ class TestTurnStateMachine:
 
 
 class TestTurnValidation:
-    def test_rejects_non_driver(self, turn_env: tuple[Path, Driver, Git]) -> None:
+    def test_rejects_non_driver(
+        self, shared_turn_env: tuple[Path, Driver, Git]
+    ) -> None:
         """Turn requires Driver instance."""
-        root_dir, _, git = turn_env
+        root_dir, _, git = shared_turn_env
         with pytest.raises(TypeError, match="expected Driver"):
             Turn("not a driver", git, root_dir)  # type: ignore[arg-type]
 
-    def test_rejects_non_git(self, turn_env: tuple[Path, Driver, Git]) -> None:
+    def test_rejects_non_git(self, shared_turn_env: tuple[Path, Driver, Git]) -> None:
         """Turn requires Git instance."""
-        root_dir, driver, _ = turn_env
+        root_dir, driver, _ = shared_turn_env
         with pytest.raises(TypeError, match="expected Git"):
             Turn(driver, "not a git", root_dir)  # type: ignore[arg-type]
 
     def test_rejects_non_path_session_root(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """Turn requires Path for session_root."""
-        _, driver, git = turn_env
+        _, driver, git = shared_turn_env
         with pytest.raises(TypeError, match="expected Path"):
             Turn(driver, git, "/tmp/path")  # type: ignore[arg-type]
 
     def test_rejects_relative_session_root(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """Turn requires absolute path for session_root."""
-        _, driver, git = turn_env
+        _, driver, git = shared_turn_env
         with pytest.raises(ValueError, match="absolute"):
             Turn(driver, git, Path("relative/path"))
 
     def test_start_rejects_string_transition_type(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """start() requires TransitionType instance."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
         with pytest.raises(TypeError, match="expected TransitionType"):
             turn.start(1, "coding")  # type: ignore[arg-type]
 
     def test_start_rejects_non_int_turn_number(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """start() requires int for turn_number."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
         with pytest.raises(TypeError, match="expected int"):
             turn.start("1", TransitionType("coding"))  # type: ignore[arg-type]
 
     def test_start_rejects_zero_turn_number(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """start() rejects turn_number < 1."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
         with pytest.raises(ValueError, match="must be >= 1"):
             turn.start(0, TransitionType("coding"))
 
     def test_log_file_raises_before_start(
-        self, turn_env: tuple[Path, Driver, Git]
+        self, shared_turn_env: tuple[Path, Driver, Git]
     ) -> None:
         """log_file property raises if Turn not started."""
-        root_dir, driver, git = turn_env
+        root_dir, driver, git = shared_turn_env
         turn = Turn(driver, git, root_dir)
         with pytest.raises(RuntimeError, match="Cannot get log_file.*INITIAL"):
             _ = turn.log_file
@@ -333,3 +289,24 @@ class TestTurnRepr:
         repr_str = repr(turn)
         assert "number=1" in repr_str
         assert "IN_PROGRESS" in repr_str
+
+
+class TestTurnBenchmark:
+    def test_bench_turn_lifecycle(
+        self, benchmark: BenchmarkFixture, turn_env: tuple[Path, Driver, Git]
+    ) -> None:
+        """Time one start() -> execute() -> finish() cycle against fake claude.
+
+        Timed only with `--benchmark-enable --dist=no`; addopts disables
+        benchmarks, so a plain run executes the cycle once as an ordinary test.
+        """
+        root_dir, driver, git = turn_env
+
+        def lifecycle() -> TurnState:
+            turn = Turn(driver, git, root_dir)
+            turn.start(1, TransitionType("coding"))
+            turn.execute("prompt")
+            turn.finish("success", "abc123", "test message")
+            return turn.state
+
+        assert benchmark(lifecycle) == TurnState.FINISHED
@@ -1,5 +1,6 @@
 """Tests for TurnLog class."""
 
+import re
 from pathlib import Path
 
 import pytest
@@ -7,93 +8,96 @@ import pytest
 from afk.transition_type import TransitionType
 from afk.turn_log import TurnLog
 
+TT_INIT = TransitionType("init")
+TT_CODING = TransitionType("coding")
 
-class TestTurnLogFilename:
-    """Tests for TurnLog.filename property."""
+# Compiled once for pytest.raises(match=...)
+_TURN_NUMBER_RANGE = re.compile("between 1 and 99999")
 
-    def test_basic_format(self, tmp_path: Path) -> None:
-        """AC #1: turn number 3 with transition type 'coding' produces 'turn-00003-coding.log'."""
-        log = TurnLog(3, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-00003-coding.log"
 
-    def test_zero_padding_single_digit(self, tmp_path: Path) -> None:
-        """Single digit turn numbers are zero-padded to 5 digits."""
-        log = TurnLog(1, TransitionType("init"), tmp_path)
-        assert log.filename == "turn-00001-init.log"
+@pytest.fixture(scope="module")
+def shared_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session root shared by tests that only inspect names and paths, not contents.
 
-    def test_zero_padding_double_digit(self, tmp_path: Path) -> None:
-        """Zero-padding works for double digit turn numbers."""
-        log = TurnLog(10, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-00010-coding.log"
+    TurnLog writes its log file on construction, so the root must be real.
+    """
+    return tmp_path_factory.mktemp("turn_log")
 
-    def test_zero_padding_triple_digit(self, tmp_path: Path) -> None:
-        """Zero-padding works for triple digit turn numbers."""
-        log = TurnLog(100, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-00100-coding.log"
 
-    def test_zero_padding_four_digit(self, tmp_path: Path) -> None:
-        """Zero-padding works for four digit turn numbers."""
-        log = TurnLog(1000, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-01000-coding.log"
+class TestTurnLogFilename:
+    """Tests for TurnLog.filename property."""
 
-    def test_zero_padding_max_turns(self, tmp_path: Path) -> None:
-        """Zero-padding works for maximum turn count."""
-        log = TurnLog(99999, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-99999-coding.log"
+    @pytest.mark.parametrize(
+        ("turn_number", "transition_type", "expected"),
+        [
+            pytest.param(3, "coding", "turn-00003-coding.log", id="basic"),
+            pytest.param(1, "init", "turn-00001-init.log", id="single_digit"),
+            pytest.param(10, "coding", "turn-00010-coding.log", id="double_digit"),
+            pytest.param(100, "coding", "turn-00100-coding.log", id="triple_digit"),
+            pytest.param(1000, "coding", "turn-01000-coding.log", id="four_digit"),
+            pytest.param(99999, "coding", "turn-99999-coding.log", id="max_turns"),
+        ],
+    )
+    def test_filename_format(
+        self, turn_number: int, transition_type: str, expected: str, shared_root: Path
+    ) -> None:
+        """AC #1: filename is turn-{NNNNN}-{type}.log, zero-padded to 5 digits."""
+        log = TurnLog(turn_number, TransitionType(transition_type), shared_root)
+        assert log.filename == expected
 
     def test_different_transition_types_produce_different_filenames(
-        self, tmp_path: Path
+        self, shared_root: Path
     ) -> None:
         """AC #2: Different transition types produce different filenames."""
-        init_log = TurnLog(1, TransitionType("init"), tmp_path)
-        coding_log = TurnLog(1, TransitionType("coding"), tmp_path)
+        init_log = TurnLog(1, TT_INIT, shared_root)
+        coding_log = TurnLog(1, TT_CODING, shared_root)
         assert init_log.filename != coding_log.filename
         assert init_log.filename == "turn-00001-init.log"
         assert coding_log.filename == "turn-00001-coding.log"
 
     def test_different_turn_numbers_produce_different_filenames(
-        self, tmp_path: Path
+        self, shared_root: Path
     ) -> None:
         """AC #2: Different turn numbers produce different filenames."""
-        turn_1 = TurnLog(1, TransitionType("coding"), tmp_path)
-        turn_2 = TurnLog(2, TransitionType("coding"), tmp_path)
+        turn_1 = TurnLog(1, TT_CODING, shared_root)
+        turn_2 = TurnLog(2, TT_CODING, shared_root)
         assert turn_1.filename != turn_2.filename
 
 
 class TestTurnLogPath:
     """Tests for TurnLog.path property."""
 
-    def test_combines_session_root_logs_and_filename(self, tmp_path: Path) -> None:
+    def test_combines_session_root_logs_and_filename(self, shared_root: Path) -> None:
         """Path combines session_root/logs and filename correctly."""
-        log = TurnLog(3, TransitionType("coding"), tmp_path)
-        expected = tmp_path / "logs" / "turn-00003-coding.log"
+        log = TurnLog(3, TT_CODING, shared_root)
+        expected = shared_root / "logs" / "turn-00003-coding.log"
         assert log.path == expected
 
-    def test_returns_absolute_path(self, tmp_path: Path) -> None:
+    def test_returns_absolute_path(self, shared_root: Path) -> None:
         """Path property returns an absolute path."""
-        log = TurnLog(1, TransitionType("init"), tmp_path)
+        log = TurnLog(1, TT_INIT, shared_root)
         assert log.path.is_absolute()
 
-    def test_path_with_nested_session_root(self, tmp_path: Path) -> None:
+    def test_path_with_nested_session_root(self, shared_root: Path) -> None:
         """Path works with nested session root structures."""
-        session_root = tmp_path / "runs" / "session-001"
-        session_root.mkdir(parents=True)
+        session_root = shared_root / "runs" / "session-001"
+        session_root.mkdir(parents=True, exist_ok=True)
         log = TurnLog(5, TransitionType("review"), session_root)
         assert log.path == session_root / "logs" / "turn-00005-review.log"
         assert log.path.is_absolute()
 
-    def test_log_dir_returns_session_root_plus_logs(self, tmp_path: Path) -> None:
+    def test_log_dir_returns_session_root_plus_logs(self, shared_root: Path) -> None:
         """log_dir property returns session_root/logs."""
-        log = TurnLog(1, TransitionType("init"), tmp_path)
-        assert log.log_dir == tmp_path / "logs"
+        log = TurnLog(1, TT_INIT, shared_root)
+        assert log.log_dir == shared_root / "logs"
 
 
 class TestTurnLogRepr:
     """Tests for TurnLog.__repr__ method."""
 
-    def test_repr_format(self, tmp_path: Path) -> None:
+    def test_repr_format(self, shared_root: Path) -> None:
         """Repr provides useful debugging information."""
-        log = TurnLog(3, TransitionType("coding"), tmp_path)
+        log = TurnLog(3, TT_CODING, shared_root)
         repr_str = repr(log)
         assert "TurnLog" in repr_str
         assert "3" in repr_str
@@ -103,65 +107,61 @@ class TestTurnLogRepr:
 class TestTurnLogValidation:
     """Tests for TurnLog input validation (transition type validation delegated to TransitionType)."""
 
-    def test_accepts_simple_lowercase(self, tmp_path: Path) -> None:
-        """Simple lowercase transition types are valid."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-00001-coding.log"
-
-    def test_accepts_with_digits(self, tmp_path: Path) -> None:
-        """Transition types with digits after first char are valid."""
-        log = TurnLog(1, TransitionType("step2"), tmp_path)
-        assert log.filename == "turn-00001-step2.log"
-
-    def test_accepts_with_hyphen(self, tmp_path: Path) -> None:
-        """Transition types with hyphens are valid."""
-        log = TurnLog(1, TransitionType("code-review"), tmp_path)
-        assert log.filename == "turn-00001-code-review.log"
-
-    def test_accepts_with_underscore(self, tmp_path: Path) -> None:
-        """Transition types with underscores are valid."""
-        log = TurnLog(1, TransitionType("code_review"), tmp_path)
-        assert log.filename == "turn-00001-code_review.log"
-
-    def test_accepts_with_dot(self, tmp_path: Path) -> None:
-        """Transition types with dots after first char are valid."""
-        log = TurnLog(1, TransitionType("v1.0"), tmp_path)
-        assert log.filename == "turn-00001-v1.0.log"
-
-    def test_rejects_turn_number_zero(self, tmp_path: Path) -> None:
-        """Turn number 0 raises ValueError."""
-        with pytest.raises(ValueError, match="between 1 and 99999"):
-            TurnLog(0, TransitionType("coding"), tmp_path)
-
-    def test_rejects_turn_number_negative(self, tmp_path: Path) -> None:
-        """Negative turn number raises ValueError."""
-        with pytest.raises(ValueError, match="between 1 and 99999"):
-            TurnLog(-1, TransitionType("coding"), tmp_path)
-
-    def test_rejects_turn_number_too_large(self, tmp_path: Path) -> None:
-        """Turn number > 99999 raises ValueError."""
-        with pytest.raises(ValueError, match="between 1 and 99999"):
-            TurnLog(100000, TransitionType("coding"), tmp_path)
-
-    def test_accepts_turn_number_min(self, tmp_path: Path) -> None:
-        """Turn number 1 is valid."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-00001-coding.log"
-
-    def test_accepts_turn_number_max(self, tmp_path: Path) -> None:
-        """Turn number 99999 is valid."""
-        log = TurnLog(99999, TransitionType("coding"), tmp_path)
-        assert log.filename == "turn-99999-coding.log"
-
-    def test_rejects_string_transition_type(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        "transition_type",
+        [
+            pytest.param("coding", id="simple_lowercase"),
+            pytest.param("step2", id="with_digits"),
+            pytest.param("code-review", id="with_hyphen"),
+            pytest.param("code_review", id="with_underscore"),
+            pytest.param("v1.0", id="with_dot"),
+        ],
+    )
+    def test_accepts_transition_type(
+        self, transition_type: str, shared_root: Path
+    ) -> None:
+        """Any valid TransitionType appears verbatim in the filename."""
+        log = TurnLog(1, TransitionType(transition_type), shared_root)
+        assert log.filename == f"turn-00001-{transition_type}.log"
+
+    @pytest.mark.parametrize(
+        "turn_number",
+        [
+            pytest.param(0, id="zero"),
+            pytest.param(-1, id="negative"),
+            pytest.param(100000, id="too_large"),
+        ],
+    )
+    def test_rejects_out_of_range_turn_number(
+        self, turn_number: int, shared_root: Path
+    ) -> None:
+        """Turn numbers outside 1..99999 raise ValueError."""
+        with pytest.raises(ValueError, match=_TURN_NUMBER_RANGE):
+            TurnLog(turn_number, TT_CODING, shared_root)
+
+    @pytest.mark.parametrize(
+        ("turn_number", "expected"),
+        [
+            pytest.param(1, "turn-00001-coding.log", id="min"),
+            pytest.param(99999, "turn-99999-coding.log", id="max"),
+        ],
+    )
+    def test_accepts_turn_number_at_bounds(
+        self, turn_number: int, expected: str, shared_root: Path
+    ) -> None:
+        """Turn numbers 1 and 99999 are valid."""
+        log = TurnLog(turn_number, TT_CODING, shared_root)
+        assert log.filename == expected
+
+    def test_rejects_string_transition_type(self, shared_root: Path) -> None:
         """String transition type raises TypeError."""
         with pytest.raises(TypeError, match="expected TransitionType, got 'coding'"):
-            TurnLog(1, "coding", tmp_path)  # type: ignore[arg-type]
+            TurnLog(1, "coding", shared_root)  # type: ignore[arg-type]
 
     def test_rejects_string_session_root(self) -> None:
         """String session_root raises TypeError."""
         with pytest.raises(TypeError, match="expected Path"):
-            TurnLog(1, TransitionType("coding"), "/tmp")  # type: ignore[arg-type]
+            TurnLog(1, TT_CODING, "/tmp")  # type: ignore[arg-type]
 
 
 class TestTurnLogInit:
@@ -171,14 +171,14 @@ class TestTurnLogInit:
         """TurnLog creates log directory at instantiation."""
         assert not (tmp_path / "logs").exists()
 
-        TurnLog(1, TransitionType("coding"), tmp_path)
+        TurnLog(1, TT_CODING, tmp_path)
 
         assert (tmp_path / "logs").exists()
         assert (tmp_path / "logs").is_dir()
 
     def test_init_creates_log_file_with_start_marker(self, tmp_path: Path) -> None:
         """TurnLog creates log file with START marker at instantiation."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         content = log.path.read_text()
         assert content == "=== Turn 1 START ===\n"
@@ -190,7 +190,7 @@ class TestTurnLogInit:
         existing_log = logs_dir / "turn-00001-coding.log"
         existing_log.write_text("old content\n")
 
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         content = log.path.read_text()
         assert content == "=== Turn 1 START ===\n"
@@ -202,7 +202,7 @@ class TestTurnLogLog:
 
     def test_log_appends_after_start_marker(self, tmp_path: Path) -> None:
         """log() appends message after the START marker."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         log.log("hello world")
 
@@ -211,7 +211,7 @@ class TestTurnLogLog:
 
     def test_log_multiple_calls_append_in_order(self, tmp_path: Path) -> None:
         """Multiple log() calls append messages in order."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         log.log("first")
         log.log("second")
@@ -222,7 +222,7 @@ class TestTurnLogLog:
 
     def test_log_handles_empty_message(self, tmp_path: Path) -> None:
         """log() handles empty string message."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         log.log("")
 
@@ -231,7 +231,7 @@ class TestTurnLogLog:
 
     def test_log_handles_multiline_message(self, tmp_path: Path) -> None:
         """log() handles messages containing newlines."""
-        log = TurnLog(1, TransitionType("coding"), tmp_path)
+        log = TurnLog(1, TT_CODING, tmp_path)
 
         log.log("line1\nline2\nline3")
 
@@ -6,27 +6,33 @@ import pytest
 from afk.transition_type import TransitionType
 from afk.turn_result import TurnResult
 
+TT_INIT = TransitionType("init")
+TT_CODING = TransitionType("coding")
+
+# Tests only need some tz-aware datetime; the clock is never consulted.
+_FIXED_TS = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+_DEFAULTS = {
+    "turn_number": 1,
+    "transition_type": TT_CODING,
+    "outcome": "success",
+    "message": "test message",
+    "commit_hash": "abc123",
+    "log_file": Path("/logs/turn-00001-coding.log"),
+    "timestamp": _FIXED_TS,
+}
+
 
 def _make_result(**overrides) -> TurnResult:
     """Helper to create TurnResult with sensible defaults."""
-    defaults = {
-        "turn_number": 1,
-        "transition_type": TransitionType("coding"),
-        "outcome": "success",
-        "message": "test message",
-        "commit_hash": "abc123",
-        "log_file": Path("/logs/turn-00001-coding.log"),
-        "timestamp": datetime.now(timezone.utc),
-    }
-    defaults.update(overrides)
-    return TurnResult(**defaults)
+    return TurnResult(**{**_DEFAULTS, **overrides})
 
 
 class TestTurnResultBasics:
     def test_creates_turn_result_with_all_fields(self) -> None:
-        ts = datetime.now(timezone.utc)
+        ts = _FIXED_TS
         log_file = Path("/logs/turn-00001-init.log")
-        transition_type = TransitionType("init")
+        transition_type = TT_INIT
 
         result = TurnResult(
             turn_number=1,
@@ -38,13 +44,25 @@ class TestTurnResultBasics:
             timestamp=ts,
         )
 
-        assert result.turn_number == 1
-        assert result.transition_type == transition_type
-        assert result.outcome == "success"
-        assert result.message == "feat: add feature\n\noutcome: success"
-        assert result.commit_hash == "abc123def456"
-        assert result.log_file == log_file
-        assert result.timestamp == ts
+        # Compare accessors against literals, not against a second TurnResult:
+        # __eq__ would still pass if the constructor mixed up two fields
+        assert (
+            result.turn_number,
+            result.transition_type,
+            result.outcome,
+            result.message,
+            result.commit_hash,
+            result.log_file,
+            result.timestamp,
+        ) == (
+            1,
+            transition_type,
+            "success",
+            "feat: add feature\n\noutcome: success",
+            "abc123def456",
+            log_file,
+            ts,
+        )
 
     def test_turn_result_is_immutable(self) -> None:
         result = _make_result()
@@ -52,10 +70,10 @@ class TestTurnResultBasics:
             result.outcome = "failure"  # type: ignore[misc]
 
     def test_turn_result_equality(self) -> None:
-        ts = datetime.now(timezone.utc)
+        ts = _FIXED_TS
         kwargs = {
             "turn_number": 1,
-            "transition_type": TransitionType("coding"),
+            "transition_type": TT_CODING,
             "outcome": "success",
             "message": "msg",
             "commit_hash": "abc123",
@@ -75,58 +93,66 @@ class TestTurnResultBasics:
 
 
 class TestTurnResultValidation:
-    def test_rejects_non_int_turn_number(self) -> None:
-        with pytest.raises(TypeError, match="expected int for turn_number"):
-            _make_result(turn_number="1")  # type: ignore[arg-type]
-
-    def test_rejects_turn_number_zero(self) -> None:
-        with pytest.raises(ValueError, match="turn_number must be >= 1"):
-            _make_result(turn_number=0)
-
-    def test_rejects_negative_turn_number(self) -> None:
-        with pytest.raises(ValueError, match="turn_number must be >= 1"):
-            _make_result(turn_number=-1)
+    @pytest.mark.parametrize(
+        ("field", "value", "match"),
+        [
+            pytest.param(
+                "turn_number", "1", "expected int for turn_number", id="turn_number"
+            ),
+            pytest.param(
+                "transition_type",
+                "coding",
+                "expected TransitionType",
+                id="transition_type",
+            ),
+            pytest.param(
+                "outcome", 123, "expected str or None for outcome", id="outcome"
+            ),
+            pytest.param("message", 123, "expected str for message", id="message"),
+            pytest.param(
+                "commit_hash", 123, "expected str for commit_hash", id="commit_hash"
+            ),
+            pytest.param(
+                "log_file",
+                "/logs/turn.log",
+                "expected Path for log_file",
+                id="log_file",
+            ),
+        ],
+    )
+    def test_rejects_wrong_type(self, field: str, value: object, match: str) -> None:
+        with pytest.raises(TypeError, match=match):
+            _make_result(**{field: value})
+
+    @pytest.mark.parametrize(
+        ("field", "value", "match"),
+        [
+            pytest.param("turn_number", 0, "turn_number must be >= 1", id="zero"),
+            pytest.param("turn_number", -1, "turn_number must be >= 1", id="negative"),
+            pytest.param(
+                "log_file", Path("relative/path.log"), "absolute", id="relative_log"
+            ),
+            pytest.param("log_file", Path(""), "absolute", id="empty_log"),
+            pytest.param(
+                "timestamp",
+                datetime(2025, 1, 1, 12, 0),
+                "timezone-aware",
+                id="naive_timestamp",
+            ),
+        ],
+    )
+    def test_rejects_invalid_value(self, field: str, value: object, match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            _make_result(**{field: value})
 
     def test_accepts_large_turn_number(self) -> None:
         result = _make_result(turn_number=999999)
         assert result.turn_number == 999999
 
-    def test_rejects_string_transition_type(self) -> None:
-        with pytest.raises(TypeError, match="expected TransitionType"):
-            _make_result(transition_type="coding")  # type: ignore[arg-type]
-
-    def test_rejects_non_string_outcome(self) -> None:
-        with pytest.raises(TypeError, match="expected str or None for outcome"):
-            _make_result(outcome=123)  # type: ignore[arg-type]
-
     def test_accepts_none_outcome(self) -> None:
         result = _make_result(outcome=None)
         assert result.outcome is None
 
-    def test_rejects_non_string_message(self) -> None:
-        with pytest.raises(TypeError, match="expected str for message"):
-            _make_result(message=123)  # type: ignore[arg-type]
-
-    def test_rejects_non_string_commit_hash(self) -> None:
-        with pytest.raises(TypeError, match="expected str for commit_hash"):
-            _make_result(commit_hash=123)  # type: ignore[arg-type]
-
-    def test_rejects_non_path_log_file(self) -> None:
-        with pytest.raises(TypeError, match="expected Path for log_file"):
-            _make_result(log_file="/logs/turn.log")  # type: ignore[arg-type]
-
-    def test_rejects_relative_log_file(self) -> None:
-        with pytest.raises(ValueError, match="absolute"):
-            _make_result(log_file=Path("relative/path.log"))
-
-    def test_rejects_empty_log_file(self) -> None:
-        with pytest.raises(ValueError, match="absolute"):
-            _make_result(log_file=Path(""))
-
-    def test_rejects_naive_timestamp(self) -> None:
-        with pytest.raises(ValueError, match="timezone-aware"):
-            _make_result(timestamp=datetime.now())
-
     def test_normalizes_timestamp_to_utc(self) -> None:
         ts = datetime(2025, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
         result = _make_result(timestamp=ts)